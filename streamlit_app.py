@@ -2,13 +2,35 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
 import calendar
+import html
 import numpy as np
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 import io
 
 st.set_page_config(layout="wide", page_title="Sprint Calendar Visualizer")
 
+# Monday-first calendar used to lay out each month's weeks
+MONTH_CALENDAR = calendar.Calendar(firstweekday=calendar.MONDAY)
+
+# Day names for the header (shortened)
+DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Shared styles for the HTML calendar; sprint colors are appended per render
+CALENDAR_CSS = (
+    ".sprint-cal .months{display:grid;gap:1.5rem}"
+    ".sprint-cal table{border-collapse:collapse;width:100%;table-layout:fixed;margin:0}"
+    ".sprint-cal caption{caption-side:top;font-weight:bold;font-size:1.1rem;text-align:center;padding-bottom:.4rem}"
+    ".sprint-cal th,.sprint-cal td{border:1px solid #ccc;text-align:center;padding:.3rem 0}"
+    ".sprint-cal th{background:#e6e6e6;font-weight:bold}"
+    ".sprint-cal .we{background:#f2f2f2}"
+    ".sprint-cal .legend{display:flex;flex-wrap:wrap;gap:1rem;justify-content:center;margin-top:1rem}"
+    ".sprint-cal .legend i{display:inline-block;width:1em;height:1em;margin-right:.3em;vertical-align:middle}"
+)
+
+@st.cache_data(show_spinner=False, max_entries=32)
 def parse_sprint_data(text):
     """Parse sprint data from text input."""
     lines = [line.strip() for line in text.strip().split('\n') if line.strip()]
@@ -16,65 +38,91 @@ def parse_sprint_data(text):
     # Skip the header line
     data_lines = lines[1:]
     
-    sprints = []
+    names, starts, ends = [], [], []
     for line in data_lines:
         parts = line.split()
         if len(parts) >= 3:
-            sprint_name = parts[0]
-            start_date = parts[1]
-            end_date = parts[2]
-            
-            sprints.append({
-                'Sprint': sprint_name,
-                'Start Date': pd.to_datetime(start_date),
-                'End Date': pd.to_datetime(end_date)
-            })
+            names.append(parts[0])
+            starts.append(parts[1])
+            ends.append(parts[2])
     
-    return pd.DataFrame(sprints)
+    # Convert each date column in a single call rather than once per line
+    return pd.DataFrame({
+        'Sprint': names,
+        'Start Date': pd.to_datetime(starts, format='%Y-%m-%d'),
+        'End Date': pd.to_datetime(ends, format='%Y-%m-%d')
+    })
 
-def generate_wall_calendar(df):
-    """Generate a wall-style calendar visualization of sprints."""
-    if df.empty:
-        return None
+def get_months_to_display(df):
+    """Return the (year, month) pairs between the first sprint start and the
+    last sprint end, skipping months that no sprint overlaps."""
+    periods = pd.period_range(df['Start Date'].min(), df['End Date'].max(), freq='M')
+    month_starts = periods.start_time.values.astype('datetime64[D]')
+    month_ends = periods.end_time.values.astype('datetime64[D]')
     
-    # Get the min and max dates to determine the calendar range
-    min_date = df['Start Date'].min()
-    max_date = df['End Date'].max()
+    # A month is covered if any sprint overlaps it: shape (num_sprints, num_months)
+    starts = df['Start Date'].values.astype('datetime64[D]')
+    ends = df['End Date'].values.astype('datetime64[D]')
+    covered = ((starts[:, None] <= month_ends[None, :])
+               & (ends[:, None] >= month_starts[None, :])).any(axis=0)
     
-    # Get the range of months to display
-    start_month = (min_date.year, min_date.month)
-    end_month = (max_date.year, max_date.month)
-    
-    # Generate list of all months to display
-    months_to_display = []
-    current_year, current_month = start_month
-    while (current_year, current_month) <= end_month:
-        months_to_display.append((current_year, current_month))
-        current_month += 1
-        if current_month > 12:
-            current_month = 1
-            current_year += 1
-    
-    # Determine the grid layout
-    num_months = len(months_to_display)
-    cols = min(3, num_months)  # Maximum 3 columns
-    rows = (num_months + cols - 1) // cols
+    return [(year, month)
+            for year, month, has_sprint in zip(periods.year.tolist(), periods.month.tolist(), covered)
+            if has_sprint]
+
+def get_month_days(year, month):
+    """Return a (num_weeks, 7) array of day numbers for a month, 0 outside it."""
+    return np.fromiter(MONTH_CALENDAR.itermonthdays(year, month), dtype=np.int8).reshape(-1, 7)
+
+def get_day_owners(days, year, month, starts, ends):
+    """Return the index of the sprint owning each cell of a month's day array.
+
+    Cells outside the month or not covered by any sprint have an owner of -1.
+    """
+    # Work out which sprint (if any) owns each day of the month in one
+    # broadcast comparison: shape (num_sprints, num_weeks, 7)
+    day_dates = np.datetime64(f"{year}-{month:02d}-01") + (days - 1).astype('timedelta64[D]')
+    in_sprint = ((day_dates[None, :, :] >= starts[:, None, None])
+                 & (day_dates[None, :, :] <= ends[:, None, None])
+                 & (days > 0)[None, :, :])
     
-    # Create figure with appropriate size
-    fig = plt.figure(figsize=(5*cols, 4*rows))
+    # Later sprints take precedence on overlapping days
+    owner = len(starts) - 1 - in_sprint[::-1].argmax(axis=0)
+    owner[~in_sprint.any(axis=0)] = -1
     
+    return owner
+
+def get_sprint_colors(sprint_names):
+    """Return the hex color of each sprint and whether that color is dark.
+
+    Colors are converted to hex strings once here so Matplotlib and the HTML
+    output never have to re-parse RGBA arrays cell by cell.
+    """
+    colors = plt.cm.tab10(np.linspace(0, 1, len(sprint_names)))
+    sprint_colors = dict(zip(sprint_names, (mcolors.to_hex(color) for color in colors)))
+    dark_sprints = {name: float(np.mean(mcolors.to_rgb(color))) < 0.5
+                    for name, color in sprint_colors.items()}
+    return sprint_colors, dark_sprints
+
+def get_calendar_figure():
+    """Return this session's calendar Figure, reused by every PNG render.
+
+    Streamlit runs a session's script on a single thread, so one Figure per
+    session can be reused across reruns instead of allocating a new one each
+    time. It is created outside pyplot so it never piles up in pyplot's
+    figure registry.
+    """
+    if 'cal_fig' not in st.session_state:
+        st.session_state['cal_fig'] = Figure()
+    return st.session_state['cal_fig']
+
+def draw_month_tables(fig, month_cells, rows, cols, sprint_names, sprint_hex, dark_sprints):
+    """Draw each month as its own Matplotlib table in a grid of subplots."""
     # Create a GridSpec layout for the months
     gs = gridspec.GridSpec(rows, cols, figure=fig)
     
-    # Day names for the header (shortened)
-    day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    
-    # Generate colors for each sprint
-    colors = plt.cm.tab10(np.linspace(0, 1, len(df)))
-    sprint_colors = {row['Sprint']: colors[i] for i, (_, row) in enumerate(df.iterrows())}
-    
     # Create calendar for each month
-    for i, (year, month) in enumerate(months_to_display):
+    for i, (year, month, days, owner) in enumerate(month_cells):
         row = i // cols
         col = i % cols
         
@@ -89,17 +137,10 @@ def generate_wall_calendar(df):
         for spine in ax.spines.values():
             spine.set_visible(False)
         
-        # Get the calendar information for this month
-        cal = calendar.monthcalendar(year, month)
-        
-        # Create a table for the calendar
-        # First row is for day names
-        cell_text = [[day_names[day] for day in range(7)]]
-        
-        # Add the day numbers from the calendar
-        for week in cal:
-            # Replace zeros with empty strings (days not in this month)
-            cell_text.append(['' if day == 0 else str(day) for day in week])
+        # Create a table for the calendar: day names, then the day numbers
+        # with empty strings for days not in this month
+        labels = np.where(days > 0, days.astype(str), '')
+        cell_text = np.vstack([DAY_NAMES, labels]).tolist()
         
         # Create the table
         table = ax.table(
@@ -116,39 +157,133 @@ def generate_wall_calendar(df):
         # Style the day names row
         for j in range(7):
             table[(0, j)].set_text_props(weight='bold')
-            table[(0, j)].set_facecolor('#e6e6e6')
-        
-        # Highlight weekends
-        for week_idx in range(1, len(cell_text)):
-            for day_idx in [5, 6]:  # Saturday and Sunday
-                if cell_text[week_idx][day_idx]:  # If the cell has a day number
-                    table[(week_idx, day_idx)].set_facecolor('#f2f2f2')
-        
-        # Get the days that belong to each sprint for this month
-        for _, sprint in df.iterrows():
-            sprint_name = sprint['Sprint']
-            sprint_start = sprint['Start Date']
-            sprint_end = sprint['End Date']
-            
-            # For each day in the month
-            for week_idx, week in enumerate(cal, 1):  # Start from index 1 as row 0 is for day names
-                for day_idx, day in enumerate(week):
-                    if day == 0:  # Skip days not in this month
-                        continue
-                    
-                    # Check if this day is in the sprint
-                    current_date = date(year, month, day)
-                    if sprint_start.date() <= current_date <= sprint_end.date():
-                        # Color the cell based on the sprint
-                        cell = table[(week_idx, day_idx)]
-                        cell.set_facecolor(sprint_colors[sprint_name])
-                        
-                        # Adjust text color for better visibility
-                        if np.mean(sprint_colors[sprint_name][:3]) < 0.5:  # If color is dark
-                            cell.get_text().set_color('white')
+        
+        # Build every cell's face color up front: the day names row, shaded
+        # weekends, then sprint days on top. None keeps the table default.
+        sprint_cells = owner >= 0
+        face = np.full((len(days) + 1, 7), None, dtype=object)
+        face[0, :] = '#e6e6e6'
+        face[1:, 5:7][days[:, 5:7] > 0] = '#f2f2f2'  # Saturday and Sunday
+        face[1:][sprint_cells] = sprint_hex[owner[sprint_cells]]
+        
+        for (week_idx, day_idx), color in np.ndenumerate(face):
+            if color is not None:
+                table[(week_idx, day_idx)].set_facecolor(color)
+        
+        # Adjust text color for better visibility on sprint days
+        for week_idx, day_idx in zip(*np.nonzero(sprint_cells)):
+            if dark_sprints[sprint_names[owner[week_idx, day_idx]]]:
+                table[(week_idx + 1, day_idx)].get_text().set_color('white')
         
         # Hide axes
         ax.axis('off')
+
+def draw_month_grid(fig, month_cells, rows, cols, sprint_names, sprint_hex, dark_sprints):
+    """Draw all months as one image on a single axes.
+
+    Every month is painted as a block of cells (title, day names, weeks) into
+    one RGBA array, so the calendar is rasterized by a single imshow rather
+    than laid out as one table per month.
+    """
+    # Each month block is 8 rows (title, day names, up to six weeks) by 7
+    # days, plus a one-cell gap between neighbouring blocks
+    block_height, block_width = 9, 8
+    img = np.ones((rows * block_height - 1, cols * block_width - 1, 4), dtype=np.float32)
+    sprint_rgba = np.array([mcolors.to_rgba(color) for color in sprint_hex], dtype=np.float32)
+    
+    ax = fig.add_subplot()
+    h_lines, v_lines = [], []
+    for i, (year, month, days, owner) in enumerate(month_cells):
+        top = (i // cols) * block_height
+        left = (i % cols) * block_width
+        header_row = top + 1
+        num_weeks = len(days)
+        
+        # Fill the day names row, shaded weekends, then sprint days on top
+        img[header_row, left:left + 7] = mcolors.to_rgba('#e6e6e6')
+        block = img[header_row + 1:header_row + 1 + num_weeks, left:left + 7]
+        block[:, 5:7][days[:, 5:7] > 0] = mcolors.to_rgba('#f2f2f2')  # Saturday and Sunday
+        sprint_cells = owner >= 0
+        block[sprint_cells] = sprint_rgba[owner[sprint_cells]]
+        
+        # Month title, day names and day numbers
+        ax.text(left + 3, top, f"{calendar.month_name[month]} {year}",
+                ha='center', va='center', fontweight='bold', fontsize=14)
+        for j, day_name in enumerate(DAY_NAMES):
+            ax.text(left + j, header_row, day_name,
+                    ha='center', va='center', fontweight='bold', fontsize=10)
+        labels = days.astype(str)
+        for week_idx, day_idx in zip(*np.nonzero(days)):
+            sprint = owner[week_idx, day_idx]
+            is_dark = sprint >= 0 and dark_sprints[sprint_names[sprint]]
+            ax.text(left + day_idx, header_row + 1 + week_idx, labels[week_idx, day_idx],
+                    ha='center', va='center', fontsize=10,
+                    color='white' if is_dark else 'black')
+        
+        # Cell borders, collected so all months share two line collections
+        y_top = header_row - 0.5
+        y_bottom = header_row + num_weeks + 0.5
+        h_lines.extend((y_top + k, left - 0.5, left + 6.5) for k in range(num_weeks + 2))
+        v_lines.extend((left - 0.5 + k, y_top, y_bottom) for k in range(8))
+    
+    ax.imshow(img, interpolation='nearest', aspect='auto')
+    # Borders on the image edge sit on the axes limits, so don't clip them
+    ax.hlines(*zip(*h_lines), colors='black', linewidth=0.8, clip_on=False)
+    ax.vlines(*zip(*v_lines), colors='black', linewidth=0.8, clip_on=False)
+    
+    # Hide axes
+    ax.axis('off')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def generate_wall_calendar_png(sprints, _fig, dpi=150, use_tables=False):
+    """Generate a wall-style calendar visualization of sprints as PNG bytes.
+
+    ``sprints`` is a hashable tuple of ``(sprint, start, end)`` rows so the
+    rendered image can be cached across reruns. The calendar is drawn on
+    ``_fig``, which is cleared first and left out of the cache key. Months are
+    drawn as a single image unless ``use_tables`` asks for one Matplotlib
+    table per month.
+    """
+    if not sprints:
+        return None
+    
+    df = pd.DataFrame(list(sprints), columns=['Sprint', 'Start Date', 'End Date'])
+    
+    # Get the range of months to display
+    months_to_display = get_months_to_display(df)
+    if not months_to_display:
+        return None
+    
+    # Determine the grid layout
+    num_months = len(months_to_display)
+    cols = min(3, num_months)  # Maximum 3 columns
+    rows = (num_months + cols - 1) // cols
+    
+    # Generate colors for each sprint
+    sprint_names = df['Sprint'].to_numpy()
+    sprint_colors, dark_sprints = get_sprint_colors(sprint_names)
+    
+    # Face color of each sprint row, indexed by the owners from get_day_owners
+    sprint_hex = np.array([sprint_colors[name] for name in sprint_names], dtype=object)
+    
+    # Sprint boundaries as day-resolution arrays for vectorized overlap tests
+    starts = df['Start Date'].values.astype('datetime64[D]')
+    ends = df['End Date'].values.astype('datetime64[D]')
+    
+    # Get the calendar information and sprint owners for each month once,
+    # shared by the labels, weekend shading and sprint colors
+    month_cells = []
+    for year, month in months_to_display:
+        days = get_month_days(year, month)
+        month_cells.append((year, month, days, get_day_owners(days, year, month, starts, ends)))
+    
+    # Reuse the caller's figure at the appropriate size
+    fig = _fig
+    fig.clear()
+    fig.set_size_inches(5*cols, 4*rows)
+    
+    draw_months = draw_month_tables if use_tables else draw_month_grid
+    draw_months(fig, month_cells, rows, cols, sprint_names, sprint_hex, dark_sprints)
     
     # Add a legend for sprints
     legend_handles = [plt.Rectangle((0, 0), 1, 1, color=sprint_colors[sprint]) 
@@ -157,9 +292,92 @@ def generate_wall_calendar(df):
               loc='lower center', bbox_to_anchor=(0.5, 0), 
               ncol=min(5, len(sprint_colors)), title="Sprints")
     
-    plt.tight_layout(rect=[0, 0.05, 1, 0.95])  # Make room for the legend
+    fig.tight_layout(rect=[0, 0.05, 1, 0.95])  # Make room for the legend
+    
+    # Cache the encoded image rather than the Figure so entries stay picklable
+    buffer = io.BytesIO()
+    # tight_layout already fits the figure, so skip the second render pass of
+    # bbox_inches='tight' and favour encoding speed over file size
+    fig.savefig(buffer, format='png', dpi=dpi,
+                pil_kwargs={'optimize': False, 'compress_level': 1})
     
-    return fig
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def generate_wall_calendar_html(sprints):
+    """Generate a wall-style calendar of sprints as an HTML snippet.
+
+    Renders the same layout as ``generate_wall_calendar_png`` but leaves the
+    drawing to the browser, which is much cheaper than rasterizing a figure.
+    """
+    if not sprints:
+        return None
+    
+    df = pd.DataFrame(list(sprints), columns=['Sprint', 'Start Date', 'End Date'])
+    months_to_display = get_months_to_display(df)
+    if not months_to_display:
+        return None
+    cols = min(3, len(months_to_display))  # Maximum 3 columns
+    
+    # Generate colors for each sprint
+    sprint_names = df['Sprint'].to_numpy()
+    sprint_colors, dark_sprints = get_sprint_colors(sprint_names)
+    
+    # One CSS class per distinct (background, text color) pair, so cells only
+    # carry a shared class name and sprints that look alike share a rule
+    style_classes = {}
+    sprint_classes = {}
+    for name, color in sprint_colors.items():
+        style = (color, '#fff' if dark_sprints[name] else '#000')
+        sprint_classes[name] = style_classes.setdefault(style, f"sp{len(style_classes)}")
+    
+    style_rules = [CALENDAR_CSS]
+    for (background, text_color), style_class in style_classes.items():
+        style_rules.append(f".sprint-cal .{style_class}{{background:{background};color:{text_color}}}")
+    
+    # Class of each sprint row, indexed by the owners from get_day_owners
+    owner_classes = [sprint_classes[name] for name in sprint_names]
+    
+    starts = df['Start Date'].values.astype('datetime64[D]')
+    ends = df['End Date'].values.astype('datetime64[D]')
+    
+    # Keep the markup on a single line so Markdown never treats indented
+    # HTML as a code block
+    parts = [
+        f"<style>{''.join(style_rules)}</style>",
+        '<div class="sprint-cal">',
+        f'<div class="months" style="grid-template-columns:repeat({cols},1fr)">',
+    ]
+    header = ''.join(f"<th>{day_name}</th>" for day_name in DAY_NAMES)
+    
+    for year, month in months_to_display:
+        days = get_month_days(year, month)
+        owner = get_day_owners(days, year, month, starts, ends)
+        
+        parts.append(f"<table><caption>{calendar.month_name[month]} {year}</caption>")
+        parts.append(f"<tr>{header}</tr>")
+        for week_idx, week in enumerate(days):
+            parts.append("<tr>")
+            for day_idx, day in enumerate(week):
+                if day == 0:
+                    parts.append("<td></td>")
+                elif owner[week_idx, day_idx] >= 0:
+                    parts.append(f'<td class="{owner_classes[owner[week_idx, day_idx]]}">{day}</td>')
+                elif day_idx >= 5:  # Saturday and Sunday
+                    parts.append(f'<td class="we">{day}</td>')
+                else:
+                    parts.append(f"<td>{day}</td>")
+            parts.append("</tr>")
+        parts.append("</table>")
+    parts.append("</div>")
+    
+    # Add a legend for sprints
+    parts.append('<div class="legend"><strong>Sprints</strong>')
+    for name in sprint_colors:
+        parts.append(f'<span><i class="{sprint_classes[name]}"></i>{html.escape(str(name))}</span>')
+    parts.append("</div></div>")
+    
+    return ''.join(parts)
 
 # App title and description
 st.title("Sprint Calendar Visualizer")
@@ -175,36 +393,84 @@ sample_data = """Sprint Name Start Date End Date
 user_input = st.text_area("Enter your sprint schedule (format: Sprint Name, Start Date, End Date):", 
                          value=sample_data, height=150)
 
-# Parse button
-if st.button("Generate Calendar"):
-    sprint_df = parse_sprint_data(user_input)
-    
-    # Show the parsed data
-    st.subheader("Parsed Sprint Data")
-    st.dataframe(sprint_df)
-    
-    # Generate and show the calendar visualization
-    st.subheader("Sprint Calendar Visualization")
-    fig = generate_wall_calendar(sprint_df)
-    if fig:
-        st.pyplot(fig)
-        
-        # Add download button for the calendar
-        buffer = io.BytesIO()
-        fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        st.download_button(
-            label="Download Calendar Image",
-            data=buffer,
-            file_name="sprint_calendar.png",
-            mime="image/png"
-        )
-    else:
-        st.error("Could not generate calendar. Please check your input format.")
-
 # Additional customization options
 st.sidebar.header("Customization Options")
-st.sidebar.write("(Future enhancement: Add color schemes, display options, etc.)")
+render_png = st.sidebar.checkbox(
+    "Render as image",
+    value=False,
+    help="Show the calendar as the Matplotlib PNG that is downloaded, rather than the faster HTML view."
+)
+image_dpi = st.sidebar.slider(
+    "Image resolution (DPI)",
+    min_value=72,
+    max_value=300,
+    value=150,
+    step=6
+)
+use_tables = st.sidebar.checkbox(
+    "Draw each month as a separate table",
+    value=False,
+    help="Use one Matplotlib table per month in the image. Slower to render than the default single-image layout."
+)
+
+@st.fragment
+def render_calendar_fragment(user_input, render_png, image_dpi, use_tables):
+    """Parse the sprint input and show the calendar when the button is clicked.
+
+    Running as a fragment means a button click reruns only this block rather
+    than the whole script; the cached parse and render calls then reduce the
+    rerun to a cache lookup when the input has not changed.
+    """
+    # Parse button
+    if st.button("Generate Calendar"):
+        try:
+            sprint_df = parse_sprint_data(user_input)
+        except ValueError:  # Dates not in YYYY-MM-DD format
+            st.error("Could not generate calendar. Please check your input format.")
+            return
+        
+        # Show the parsed data
+        st.subheader("Parsed Sprint Data")
+        st.dataframe(sprint_df)
+        
+        # Generate and show the calendar visualization
+        st.subheader("Sprint Calendar Visualization")
+        sprint_tuple = tuple(sprint_df.itertuples(index=False, name=None))
+        if render_png:
+            calendar_output = generate_wall_calendar_png(sprint_tuple, get_calendar_figure(),
+                                                         dpi=image_dpi, use_tables=use_tables)
+        else:
+            calendar_output = generate_wall_calendar_html(sprint_tuple)
+        
+        if not calendar_output:
+            st.error("Could not generate calendar. Please check your input format.")
+        elif render_png:
+            st.image(calendar_output)
+            
+            # Add download button for the calendar
+            st.download_button(
+                label="Download Calendar Image",
+                data=calendar_output,
+                file_name="sprint_calendar.png",
+                mime="image/png",
+                on_click="ignore"
+            )
+        else:
+            st.markdown(calendar_output, unsafe_allow_html=True)
+            
+            # The HTML view needs no image, so only draw and encode the PNG if
+            # the download is actually requested. The callable runs on a worker
+            # thread, so it draws on its own Figure rather than the session's.
+            st.download_button(
+                label="Download Calendar Image",
+                data=lambda: generate_wall_calendar_png(sprint_tuple, Figure(),
+                                                        dpi=image_dpi, use_tables=use_tables),
+                file_name="sprint_calendar.png",
+                mime="image/png",
+                on_click="ignore"
+            )
+
+render_calendar_fragment(user_input, render_png, image_dpi, use_tables)
 
 # Instructions
 with st.expander("How to Use"):
@@ -216,12 +482,13 @@ with st.expander("How to Use"):
        1 2025-03-24 2025-04-11
        ```
     2. Click "Generate Calendar" to visualize your sprints.
-    3. Download the calendar image if needed.
+    3. Download the calendar image if needed. Tick "Render as image" in the sidebar to preview it first.
     
     Notes:
     - Dates should be in YYYY-MM-DD format
     - Each sprint should be on a new line
     - The calendar shows each month separately in a traditional wall calendar style
+    - Months without any sprint days are left out
     - Weekends are lightly shaded
     - Days that belong to sprints are colored according to the sprint
     """) 
\ No newline at end of file